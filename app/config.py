@@ -1,6 +1,10 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+# Путь до .env вычисляется один раз при импорте модуля
+_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
 
 class DatabaseConfig(BaseSettings):
     """Класс конфигурации базы данных.
@@ -22,15 +26,35 @@ class DatabaseConfig(BaseSettings):
     DB_PASSWORD: str
 
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).parent.parent / ".env",
+        env_file=_ENV_FILE,
         env_file_encoding='utf-8',
-        extra="ignore"
+        extra="ignore",
+        # Настройки неизменяемы после загрузки
+        frozen=True
     )
 
-    @property
+    @cached_property
     def database_url_posgresql(self) -> str:
-        """Генерирует URL для подключения к PostgreSQL с использованием asyncpg."""
+        """Генерирует URL для подключения к PostgreSQL с использованием asyncpg.
+
+        Строка собирается один раз при первом обращении и кэшируется на инстансе.
+        """
         return (f'postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@'
                 f'{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}')
 
-settings = DatabaseConfig() # type: ignore
+
+def __getattr__(name: str):
+    """Совместимость со старым импортом `from app.config import settings`."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> DatabaseConfig:
+    """Возвращает единственный экземпляр конфигурации.
+
+    Конфигурация создается лениво при первом обращении и кэшируется,
+    поэтому .env файл читается не более одного раза за время работы приложения.
+    """
+    return DatabaseConfig()  # type: ignore
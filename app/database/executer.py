@@ -1,5 +1,4 @@
 from sqlalchemy import Result
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 from typing import Optional, Type, Sequence
@@ -22,6 +21,10 @@ class QueryWrapper:
         user = await wrapper.scalar_one_or_none(session)
         users = await wrapper.all(session)
     """
+    # Обертка создается на каждый запрос: фиксированный слот дешевле
+    # экземплярного __dict__ и по памяти, и по доступу к атрибуту
+    __slots__ = ("query",)
+
     def __init__(self, query):
         """
         Инициализация обертки запроса.
@@ -41,7 +44,9 @@ class QueryWrapper:
         Returns:
             Result: Результат выполнения запроса SQLAlchemy.
         """
-        logger.info(f'Выполняется query: {self.query}')
+        # Отложенное форматирование: компиляция запроса в строку происходит
+        # только если уровень DEBUG реально пишется в приемник
+        logger.debug("Выполняется query: {}", self.query)
         result = await session.execute(self.query)
         return result
 
@@ -1,9 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, Select, Result, ColumnElement, and_
+from sqlalchemy import select, insert, update, delete, func, bindparam, inspect, text, Select, Result, ColumnElement, and_
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Query
-from typing import Sequence, TypeVar, Generic, List, Type, Optional, Any, Dict
-from pydantic import BaseModel
+from sqlalchemy.orm import Query, WriteOnlyCollection
+from functools import lru_cache
+from typing import Sequence, TypeVar, Generic, List, Type, Optional, Any, Dict, AsyncIterator
+from pydantic import BaseModel, TypeAdapter
 from uuid import UUID
 from loguru import logger
 
@@ -13,6 +14,72 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Кэш уже проверенных моделей, чтобы не повторять issubclass (обход MRO)
+# при каждом создании менеджера
+_validated_models: set[type] = set()
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(schema: type) -> TypeAdapter:
+    """Возвращает закэшированный TypeAdapter для сериализации списка схем.
+
+    Адаптер строится один раз на класс схемы: граф валидации выносится
+    из цикла, и сериализация всего списка идет одним проходом.
+    """
+    return TypeAdapter(List[schema])
+
+
+@lru_cache(maxsize=256)
+def _join_chain(model: type, joins_key: tuple) -> Select:
+    """Возвращает закэшированный SELECT модели с цепочкой JOIN.
+
+    Цепочка строится один раз на уникальную комбинацию (модель, джойны),
+    повторные вызовы переиспользуют готовый запрос.
+    """
+    query = select(model)
+    for join_attr in joins_key:
+        query = query.join(join_attr)
+    return query
+
+
+@lru_cache(maxsize=512)
+def _find_stmt(model: type, filter_keys: tuple, null_keys: tuple, joins_key: tuple) -> Select:
+    """Возвращает закэшированный SELECT для поиска по простым фильтрам.
+
+    Запрос строится один раз на комбинацию (модель, имена фильтров,
+    имена NULL-фильтров, джойны); значения фильтров подставляются при
+    выполнении через bindparam. Фильтры со значением None идут отдельным
+    списком null_keys: bindparam с None дал бы 'col = NULL', который
+    не совпадает ни с чем, поэтому для них запрос фиксирует IS NULL.
+
+    Raises:
+        ValueError: Если имя фильтра не найдено в модели.
+    """
+    query = _join_chain(model, joins_key) if joins_key else select(model)
+    conditions = []
+    for key in filter_keys:
+        if not hasattr(model, key):
+            raise ValueError(f"Поле {key} не найдено в модели {model.__name__}")
+        conditions.append(getattr(model, key) == bindparam(key))
+    for key in null_keys:
+        if not hasattr(model, key):
+            raise ValueError(f"Поле {key} не найдено в модели {model.__name__}")
+        conditions.append(getattr(model, key).is_(None))
+    if conditions:
+        query = query.where(*conditions)
+    return query
+
+
+def _invalidate_query_cache(session: AsyncSession) -> None:
+    """Сбрасывает кэш результатов SELECT текущей сессии.
+
+    Вызывается после любой записи: закэшированные до нее результаты
+    больше не отражают состояние БД в рамках транзакции.
+    """
+    cache = session.info.get("query_cache")
+    if cache:
+        cache.clear()
+
 
 class QueryWrapper:
     """
@@ -24,23 +91,44 @@ class QueryWrapper:
     Атрибуты:
         query: SQLAlchemy запрос (Select, Update, Delete и т.д.).
         model_name (str): Имя модели для логирования (опционально).
-        log_prefix (str): Префикс для лог-сообщений на основе model_name.
+        params (Optional[Dict[str, Any]]): Значения bind-параметров запроса.
+        cache (Optional[dict]): Кэш результатов SELECT-запросов. Если не задан,
+            берется из session.info["query_cache"] (живет вместе с сессией).
 
     Args:
         query: SQLAlchemy запрос.
         model_name (str, optional): Имя модели для контекста логирования.
+        params (Optional[Dict[str, Any]], optional): Значения bind-параметров,
+            подставляемые при выполнении закэшированного запроса.
+        cache (Optional[dict], optional): Явный кэш результатов запросов.
     """
-    def __init__(self, query, model_name: str = ""):
+    # Обертка создается на каждый запрос: фиксированный набор слотов
+    # дешевле экземплярного __dict__ и по памяти, и по доступу к атрибутам
+    __slots__ = ("query", "model_name", "params", "cache", "_log")
+
+    def __init__(
+            self,
+            query,
+            model_name: str = "",
+            params: Optional[Dict[str, Any]] = None,
+            cache: Optional[dict] = None
+    ):
         """
         Инициализация обертки запроса.
 
         Args:
             query: SQLAlchemy запрос.
             model_name (str, optional): Имя модели для логирования.
+            params (Optional[Dict[str, Any]], optional): Значения bind-параметров.
+            cache (Optional[dict], optional): Явный кэш результатов запросов.
         """
         self.query = query
         self.model_name = model_name
-        self.log_prefix = f"[{model_name}] " if model_name else ""
+        self.params = params
+        self.cache = cache
+        # Контекст модели передается логгеру один раз через bind,
+        # сообщения остаются константными строками без форматирования
+        self._log = logger.bind(model=model_name) if model_name else logger
 
     async def execute(self, session: AsyncSession) -> Result:
         """
@@ -49,19 +137,57 @@ class QueryWrapper:
         Args:
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
 
+        Повторные SELECT с тем же ключом компиляции и параметрами в рамках
+        одной сессии отдаются из кэша результатов (FrozenResult) без
+        обращения к БД, если кэш включен.
+
         Returns:
             Result: Результат выполнения запроса.
 
         Raises:
             SQLAlchemyError: При ошибке выполнения запроса.
         """
+        return await self._execute(session, self.query)
+
+    async def _execute(self, session: AsyncSession, query) -> Result:
+        """Выполняет переданный вариант запроса с кэшированием и логированием."""
         try:
-            logger.debug(f"{self.log_prefix}Выполнение запроса")
-            result = await session.execute(self.query)
+            cache = self.cache if self.cache is not None else session.info.get("query_cache")
+            cache_key = None
+            if cache is not None and isinstance(query, Select):
+                compiled_key = query._generate_cache_key()
+                if compiled_key is not None:
+                    # Сам CacheKey нехэшируем, ключом словаря служит его .key.
+                    # .key не включает значения литеральных bind-параметров
+                    # (where(col == value)), поэтому они добавляются в ключ
+                    # отдельно — иначе запросы с разными значениями совпадут
+                    cache_key = (
+                        compiled_key.key,
+                        tuple(
+                            (bp.key, tuple(bp.value) if isinstance(bp.value, list) else bp.value)
+                            for bp in compiled_key.bindparams
+                        ),
+                        tuple(sorted(self.params.items())) if self.params else None
+                    )
+                    try:
+                        frozen = cache.get(cache_key)
+                    except TypeError:
+                        # Нехэшируемое значение bind-параметра — без кэша
+                        cache_key = None
+                    else:
+                        if frozen is not None:
+                            self._log.debug("Результат запроса взят из кэша")
+                            return frozen()
+            self._log.debug("Выполнение запроса")
+            result = await session.execute(query, self.params)
+            if cache_key is not None:
+                frozen = result.freeze()
+                cache[cache_key] = frozen
+                return frozen()
             return result
-        except SQLAlchemyError as e:
-            logger.error(f"{self.log_prefix}Ошибка при выполнении запроса: {e}")
-            raise e
+        except SQLAlchemyError:
+            self._log.exception("Ошибка при выполнении запроса")
+            raise
 
     async def scalar_one_or_none(self, session: AsyncSession) -> Optional[ModelType]:
         """
@@ -74,10 +200,16 @@ class QueryWrapper:
             Optional[ModelType]: Один объект модели или None, если не найдено.
 
         Идеально подходит для запросов, где ожидается максимум один результат.
+        К SELECT-запросу добавляется LIMIT 1, чтобы БД не производила
+        лишние строки; исходный запрос не изменяется.
         """
-        result = await self.execute(session)
+        result = await self._execute(session, self._limited_query())
         return result.scalar_one_or_none()
 
+    def _limited_query(self):
+        """Возвращает копию запроса с LIMIT 1 для одиночных выборок."""
+        return self.query.limit(1) if isinstance(self.query, Select) else self.query
+
     async def scalars_all(self, session: AsyncSession) -> Sequence[ModelType]:
         """
         Выполняет запрос и возвращает все результаты в виде последовательности.
@@ -91,6 +223,31 @@ class QueryWrapper:
         result = await self.execute(session)
         return result.scalars().all()
 
+    async def stream_scalars(self, session: AsyncSession, yield_per: int = 1000) -> AsyncIterator[ModelType]:
+        """
+        Выполняет запрос и отдает результаты построчно, не буферизуя весь набор.
+
+        В отличие от scalars_all, строки подгружаются частями по yield_per,
+        что позволяет обрабатывать большие выборки без загрузки их в память целиком.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия.
+            yield_per (int, optional): Размер подгружаемой партии строк. Defaults to 1000.
+
+        Yields:
+            ModelType: Объекты модели по одному.
+
+        Пример:
+            async for row in wrapper.stream_scalars(session):
+                process(row)
+        """
+        result = await session.stream_scalars(
+            self.query.execution_options(yield_per=yield_per),
+            self.params
+        )
+        async for row in result:
+            yield row
+
     async def scalars_first(self, session: AsyncSession) -> Optional[ModelType]:
         """
         Выполняет запрос и возвращает первый результат или None.
@@ -100,8 +257,10 @@ class QueryWrapper:
 
         Returns:
             Optional[ModelType]: Первый объект модели или None.
+
+        К SELECT-запросу добавляется LIMIT 1; исходный запрос не изменяется.
         """
-        result = await self.execute(session)
+        result = await self._execute(session, self._limited_query())
         return result.scalars().first()
 
     async def scalar(self, session: AsyncSession) -> Any:
@@ -150,6 +309,10 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     Raises:
         ValueError: Если модель не указана или не наследуется от Base.
     """
+    # Включите в подклассе, если удаление должно идти через session.delete
+    # с загрузкой объекта ради ORM-каскадов
+    _needs_orm_cascade: bool = False
+
     def __init__(self, model: Type[ModelType]):
         """
         Инициализация менеджера для работы с конкретной моделью.
@@ -160,9 +323,26 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             ValueError: Если модель не указана или не наследуется от Base.
         """
-        if not model or not issubclass(model, Base):
-            raise ValueError("Модель должна быть указана и наследоваться от Base")
+        if model not in _validated_models:
+            if not model or not issubclass(model, Base):
+                raise ValueError("Модель должна быть указана и наследоваться от Base")
+            _validated_models.add(model)
         self.model = model
+        # Базовые запросы строятся один раз на менеджер; Select иммутабелен,
+        # поэтому его можно безопасно переиспользовать между вызовами
+        self._base_select: Select = select(model)
+        # COUNT(*) вместо COUNT(id): не привязывает запрос к колонке
+        # и оставляет планировщику возможность index-only scan
+        self._base_count: Select = select(func.count()).select_from(model)
+        # Карта колонок модели: O(1) доступ к колонке по имени вместо
+        # hasattr/getattr с обходом цепочки дескрипторов на каждый фильтр
+        self._columns: Dict[str, Any] = {c.key: c for c in inspect(model).columns}
+        # Колонки с серверными значениями — только их имеет смысл
+        # перечитывать после INSERT: первичный ключ генерируется на клиенте
+        self._server_default_cols: List[str] = [
+            c.key for c in inspect(model).columns
+            if c.server_default is not None or c.server_onupdate is not None
+        ]
 
     def _add_filters_dict(self, query: Select, filters: Optional[Dict[str, Any]] = None) -> Select:
         """
@@ -186,19 +366,29 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         if not filters:
             return query
-        conditions = []
-        for key, value in filters.items():
-            if hasattr(self.model, key):
-                field = getattr(self.model, key)
-                conditions.append(field == value)
-            else:
+        try:
+            conditions = [self._columns[key] == value for key, value in filters.items()]
+        except KeyError as e:
+            raise ValueError(f"Поле {e.args[0]} не найдено в модели {self.model.__name__}") from None
+        # Несколько аргументов where объединяются через AND неявно
+        return query.where(*conditions)
+
+    def _check_columns(self, values: Dict[str, Any]) -> None:
+        """
+        Проверяет, что все ключи словаря — колонки модели.
+
+        Проверка идет по закэшированной карте колонок: ошибка в имени поля
+        обнаруживается до обращения к БД, без лишнего round-trip'а.
+
+        Args:
+            values (Dict[str, Any]): Словарь {поле: значение} для проверки.
+
+        Raises:
+            ValueError: Если какое-то поле не существует в модели.
+        """
+        for key in values:
+            if key not in self._columns:
                 raise ValueError(f"Поле {key} не найдено в модели {self.model.__name__}")
-        if conditions:
-            if len(conditions) == 1:
-                query = query.where(conditions[0])
-            else:
-                query = query.where(and_(*conditions))
-        return query
 
     @staticmethod
     def _add_filters_columns(query: Select, filters: Optional[List[ColumnElement]] = None) -> Select:
@@ -271,13 +461,18 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             query = query.join(join_attr)
         return query
 
-    async def add(self, session: AsyncSession, values: CreateSchemaType) -> ModelType:
+    async def add(self, session: AsyncSession, values: CreateSchemaType, refresh: bool = False) -> ModelType:
         """
         Создает новую запись в базе данных.
 
         Args:
             session (AsyncSession): Асинхронная сессия.
             values (CreateSchemaType): Pydantic схема с данными для создания.
+            refresh (bool, optional): Перечитать после вставки колонки
+                с серверными значениями (created_at и т.п.). Сам первичный
+                ключ flush уже получает через INSERT ... RETURNING, поэтому
+                без серверных колонок перечитывание пропускается полностью.
+                Defaults to False.
 
         Returns:
             ModelType: Созданный объект модели с заполненными полями (включая ID).
@@ -286,26 +481,38 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             SQLAlchemyError: При ошибке вставки в БД.
         """
         values_dict = values.model_dump(exclude_unset=True)
-        logger.info(f"Добавление записи {self.model.__name__} с параметрами: {values_dict}")
+        logger.info("Добавление записи {} с параметрами: {}", self.model.__name__, values_dict)
         try:
             new_object = self.model(**values_dict)
             session.add(new_object)
             await session.flush()
-            await session.refresh(new_object)
-            logger.info(f"Запись {self.model.__name__} успешно добавлена с ID: {getattr(new_object, 'id', 'N/A')}")
+            _invalidate_query_cache(session)
+            if refresh and self._server_default_cols:
+                # Узкий SELECT только серверных колонок вместо полной строки
+                await session.refresh(new_object, attribute_names=self._server_default_cols)
+            logger.info("Запись {} успешно добавлена с ID: {}", self.model.__name__, getattr(new_object, 'id', 'N/A'))
             return new_object
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при добавлении записи {self.model.__name__}: {e}")
+        except SQLAlchemyError:
+            logger.exception("Ошибка при добавлении записи {}", self.model.__name__)
             await session.rollback()
-            raise e
+            raise
 
-    async def add_all(self, session: AsyncSession, instances: List[CreateSchemaType]) -> Sequence[ModelType]:
+    async def add_all(
+            self,
+            session: AsyncSession,
+            instances: List[CreateSchemaType],
+            refresh: bool = False
+    ) -> Sequence[ModelType]:
         """
         Массовое создание записей в базе данных.
 
         Args:
             session (AsyncSession): Асинхронная сессия.
             instances (List[CreateSchemaType]): Список схем для создания.
+            refresh (bool, optional): Перечитать объекты после вставки.
+                Имеет смысл только на диалектах без INSERT ... RETURNING,
+                где серверные значения не возвращаются вставкой.
+                Defaults to False.
 
         Returns:
             Sequence[ModelType]: Список созданных объектов.
@@ -313,20 +520,47 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             SQLAlchemyError: При ошибке массовой вставки.
         """
-        instances_list = [instance.model_dump(exclude_unset=True) for instance in instances]
-        logger.info(f"Добавление {len(instances)} записей {self.model.__name__}")
+        if not instances:
+            # Пустой список параметров превратил бы executemany в одиночный
+            # INSERT значений по умолчанию
+            return []
+        logger.info("Добавление {} записей {}", len(instances), self.model.__name__)
+        # Весь список сериализуется одним проходом TypeAdapter
+        # (схема определяется по первому элементу)
+        values_list = _list_adapter(type(instances[0])).dump_python(instances, exclude_unset=True)
         try:
-            new_objects = [self.model(**values) for values in instances_list]
-            session.add_all(new_objects)
-            await session.flush()
-            for obj in new_objects:
-                await session.refresh(obj)
-            logger.info(f"Успешно добавлено {len(new_objects)} записей {self.model.__name__}")
+            if session.get_bind().dialect.insert_returning:
+                # Векторизованный INSERT ... RETURNING: одна executemany-операция
+                # вместо N конструирований ORM-объектов и дополнительного SELECT.
+                # sort_by_parameter_order гарантирует порядок RETURNING-строк
+                # как во входном списке (по клиентскому UUID-ключу)
+                stmt = insert(self.model).returning(
+                    self.model, sort_by_parameter_order=True
+                )
+                result = await session.scalars(
+                    stmt,
+                    values_list,
+                    execution_options={"populate_existing": True}
+                )
+                new_objects = result.all()
+            else:
+                # Диалект без RETURNING: одна обычная вставка через flush
+                new_objects = [self.model(**values) for values in values_list]
+                session.add_all(new_objects)
+                await session.flush()
+                if refresh:
+                    await session.execute(
+                        self._base_select
+                        .where(self.model.id.in_([obj.id for obj in new_objects]))
+                        .execution_options(populate_existing=True)
+                    )
+            _invalidate_query_cache(session)
+            logger.info("Успешно добавлено {} записей {}", len(new_objects), self.model.__name__)
             return new_objects
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при массовом добавлении записей {self.model.__name__}: {e}")
+        except SQLAlchemyError:
+            logger.exception("Ошибка при массовом добавлении записей {}", self.model.__name__)
             await session.rollback()
-            raise e
+            raise
 
     async def find_by_id(
             self,
@@ -337,6 +571,9 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Находит запись по UUID идентификатору.
 
+        Использует session.get: если объект уже загружен в identity map сессии,
+        он возвращается без обращения к БД; иначе выполняется один SELECT.
+
         Args:
             session (AsyncSession): Асинхронная сессия.
             index (UUID): Уникальный идентификатор записи.
@@ -351,12 +588,42 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         if not index:
             raise ValueError("ID записи не может быть пустым")
-        query = select(self.model).where(self.model.id == index)
+        logger.debug("{}: Поиск по ID: {}", self.model.__name__, index)
+        return await session.get(self.model, index, options=load_options or None)
+
+    async def find_many_by_ids(
+            self,
+            session: AsyncSession,
+            ids: Sequence[UUID],
+            load_options: Optional[List[Any]] = None
+    ) -> List[ModelType]:
+        """
+        Находит несколько записей по списку UUID одним запросом.
+
+        Заменяет цикл вызовов find_by_id (N round-trip'ов) на один
+        SELECT ... WHERE id IN (...).
+
+        Args:
+            session (AsyncSession): Асинхронная сессия.
+            ids (Sequence[UUID]): Идентификаторы искомых записей.
+            load_options (Optional[List[Any]]): Опции загрузки связанных данных.
+
+        Returns:
+            List[ModelType]: Найденные объекты в порядке переданных
+                идентификаторов; ненайденные ID пропускаются.
+
+        Raises:
+            SQLAlchemyError: При ошибке запроса.
+        """
+        if not ids:
+            return []
+        query = self._base_select.where(self.model.id.in_(list(ids)))
         query = self._add_loads(query, load_options)
 
-        logger.debug(f"{self.model.__name__}: Создан запрос для поиска по ID: {index}")
-        result = await session.execute(query)
-        return result.scalar_one_or_none()
+        logger.debug("{}: Поиск {} записей по списку ID", self.model.__name__, len(ids))
+        result = await session.scalars(query)
+        objects_by_id = {obj.id: obj for obj in result.all()}
+        return [objects_by_id[index] for index in ids if index in objects_by_id]
 
     def find(
             self,
@@ -388,20 +655,89 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             )
             products = await wrapper.scalars_all(session)
         """
-        logger.debug(f"{self.model.__name__}: Создание запроса для поиска одной записи")
+        logger.debug("{}: Создание запроса для поиска одной записи", self.model.__name__)
+
+        # База запроса (джойны + простые фильтры через bindparam) берется из кэша;
+        # значения фильтров подставляются при выполнении. Фильтры с None
+        # не могут идти через bindparam ('col = NULL' ничего не находит) —
+        # их имена входят в ключ кэша и компилируются в IS NULL
+        bind_filters = (
+            {key: value for key, value in filters_dict.items() if value is not None}
+            if filters_dict else {}
+        )
+        null_keys = tuple(
+            key for key in filters_dict if filters_dict[key] is None
+        ) if filters_dict else ()
+        query = _find_stmt(
+            self.model,
+            tuple(bind_filters),
+            null_keys,
+            tuple(joins) if joins else ()
+        )
+        query = self._add_filters_columns(query, filters_columns)
+        query = self._add_loads(query, load_options)
 
-        query = select(self.model)
-        query = self._add_filters_dict(query, filters_dict)
+        return QueryWrapper(query, self.model.__name__, params=bind_filters or None)
+
+    async def find_page(
+            self,
+            session: AsyncSession,
+            limit: int,
+            offset: int = 0,
+            filters_dict: Optional[Dict[str, Any]] = None,
+            filters_columns: Optional[List[ColumnElement]] = None,
+            joins: Optional[List[Any]] = None,
+            load_options: Optional[List[Any]] = None
+    ) -> tuple[List[ModelType], int]:
+        """
+        Возвращает страницу записей и общее количество одним запросом.
+
+        Вместо пары find(...) + count(...) — два round-trip'а, дважды
+        выполняющих одинаковый WHERE — общее количество считается оконной
+        функцией count() OVER () в том же SELECT.
+
+        Не подходит для запросов с DISTINCT/GROUP BY, где оконная
+        семантика отличается.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия.
+            limit (int): Размер страницы.
+            offset (int, optional): Смещение страницы. Defaults to 0.
+            filters_dict (Optional[Dict[str, Any]]): Простые фильтры по равенству.
+            filters_columns (Optional[List[ColumnElement]]): Сложные SQLAlchemy фильтры.
+            joins (Optional[List[Any]]): Список атрибутов для JOIN.
+            load_options (Optional[List[Any]]): Опции загрузки связанных данных.
+
+        Returns:
+            tuple[List[ModelType], int]: Строки страницы и общее количество
+                записей под фильтрами. Для пустой страницы количество
+                возвращается как 0.
+
+        Raises:
+            SQLAlchemyError: При ошибке запроса.
+        """
+        logger.debug("{}: Постраничный запрос limit={} offset={}", self.model.__name__, limit, offset)
+
+        query = select(self.model, func.count().over().label("_total"))
         query = self._add_joins(query, joins)
+        query = self._add_filters_dict(query, filters_dict)
         query = self._add_filters_columns(query, filters_columns)
         query = self._add_loads(query, load_options)
+        query = query.limit(limit).offset(offset)
 
-        return QueryWrapper(query, self.model.__name__)
+        result = await session.execute(query)
+        rows = result.unique().all()
+        if not rows:
+            return [], 0
+        return [row[0] for row in rows], rows[0][1]
 
     async def update_by_id(self, session: AsyncSession, index: UUID, values: UpdateSchemaType) -> Optional[ModelType]:
         """
         Обновляет запись по UUID идентификатору.
 
+        Выполняется одним UPDATE ... RETURNING вместо цепочки
+        SELECT -> UPDATE -> SELECT, что экономит два round-trip'а к БД.
+
         Args:
             session (AsyncSession): Асинхронная сессия.
             index (UUID): Идентификатор обновляемой записи.
@@ -411,31 +747,34 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Optional[ModelType]: Обновленный объект или None, если запись не найдена.
 
         Raises:
+            ValueError: Если схема содержит поля, отсутствующие в модели.
             SQLAlchemyError: При ошибке обновления.
         """
         values_dict = values.model_dump(exclude_unset=True, exclude_none=True)
         if not values_dict:
-            logger.warning(f"Нет данных для обновления записи {self.model.__name__} по ID: {index}")
+            logger.warning("Нет данных для обновления записи {} по ID: {}", self.model.__name__, index)
             return None
-        logger.info(f"Обновление записи {self.model.__name__} по ID: {index}")
+        self._check_columns(values_dict)
+        logger.info("Обновление записи {} по ID: {}", self.model.__name__, index)
         try:
-            find_object = await session.get(self.model, index)
-            if not find_object:
-                logger.warning(f"Запись {self.model.__name__} с ID {index} не найдена для обновления")
+            stmt = (
+                update(self.model)
+                .where(self.model.id == index)
+                .values(**values_dict)
+                .returning(self.model)
+                .execution_options(synchronize_session="fetch")
+            )
+            updated_object = (await session.scalars(stmt)).one_or_none()
+            _invalidate_query_cache(session)
+            if updated_object is None:
+                logger.warning("Запись {} с ID {} не найдена для обновления", self.model.__name__, index)
                 return None
-            for key, value in values_dict.items():
-                if hasattr(find_object, key):
-                    setattr(find_object, key, value)
-                else:
-                    logger.warning(f"Поле {key} не существует в модели {self.model.__name__}")
-            await session.flush()
-            await session.refresh(find_object)
-            logger.info(f"Запись {self.model.__name__} с ID {index} успешно обновлена")
-            return find_object
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при обновлении записи {self.model.__name__} с ID {index}: {e}")
+            logger.info("Запись {} с ID {} успешно обновлена", self.model.__name__, index)
+            return updated_object
+        except SQLAlchemyError:
+            logger.exception("Ошибка при обновлении записи {} с ID {}", self.model.__name__, index)
             await session.rollback()
-            raise e
+            raise
 
     async def update_all(
             self,
@@ -455,25 +794,33 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             None
 
         Raises:
+            ValueError: Если схема или фильтры содержат поля,
+                отсутствующие в модели.
             SQLAlchemyError: При ошибке массового обновления.
         """
         values_dict = values.model_dump(exclude_unset=True, exclude_none=True)
+        self._check_columns(values_dict)
         try:
             query = update(self.model)
-            if filters_dict:
-                query = query.filter_by(**filters_dict)
+            query = self._add_filters_dict(query, filters_dict)
             query = query.values(**values_dict)
             result = await session.execute(query)
             await session.flush()
-            logger.info(f"Обновлено {result.rowcount} записей {self.model.__name__}")
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при обновлении записей {self.model.__name__}: {e}")
-            raise e
+            _invalidate_query_cache(session)
+            logger.info("Обновлено {} записей {}", result.rowcount, self.model.__name__)
+        except SQLAlchemyError:
+            logger.exception("Ошибка при обновлении записей {}", self.model.__name__)
+            raise
 
     async def delete_by_id(self, session: AsyncSession, index: UUID) -> None:
         """
         Удаляет запись по UUID идентификатору.
 
+        Выполняет DELETE ... WHERE id = :id напрямую, без предварительного
+        SELECT объекта. Если модели нужны ORM-каскады (обработка связей на
+        стороне Python), установите _needs_orm_cascade = True в подклассе
+        менеджера — тогда объект будет загружен и удален через session.delete.
+
         Args:
             session (AsyncSession): Асинхронная сессия.
             index (UUID): Идентификатор удаляемой записи.
@@ -481,15 +828,20 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             SQLAlchemyError: При ошибке удаления.
         """
-        logger.info(f"Удаление записи {self.model.__name__} по ID: {index}")
+        logger.info("Удаление записи {} по ID: {}", self.model.__name__, index)
         try:
-            delete_object = await session.get(self.model, index)
-            await session.delete(delete_object)
+            if self._needs_orm_cascade:
+                delete_object = await session.get(self.model, index)
+                if delete_object is not None:
+                    await session.delete(delete_object)
+            else:
+                await session.execute(delete(self.model).where(self.model.id == index))
             await session.flush()
-            logger.info(f"Запись {self.model.__name__} с ID {index} удалена")
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при удалении записи {self.model.__name__} с ID {index}: {e}")
-            raise e
+            _invalidate_query_cache(session)
+            logger.info("Запись {} с ID {} удалена", self.model.__name__, index)
+        except SQLAlchemyError:
+            logger.exception("Ошибка при удалении записи {} с ID {}", self.model.__name__, index)
+            raise
 
     async def delete_all(self, session: AsyncSession, filters_dict: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -505,17 +857,18 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             SQLAlchemyError: При ошибке массового удаления.
         """
-        logger.info(f"Удаление записей {self.model.__name__} по фильтрам")
+        logger.info("Удаление записей {} по фильтрам", self.model.__name__)
         try:
             query = delete(self.model)
             if filters_dict:
                 query = query.filter_by(**filters_dict)
             result = await session.execute(query)
             await session.flush()
-            logger.info(f"Удалено {result.rowcount} записей {self.model.__name__}")
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при удалении записей {self.model.__name__}: {e}")
-            raise e
+            _invalidate_query_cache(session)
+            logger.info("Удалено {} записей {}", result.rowcount, self.model.__name__)
+        except SQLAlchemyError:
+            logger.exception("Ошибка при удалении записей {}", self.model.__name__)
+            raise
 
     async def count(
             self,
@@ -523,6 +876,7 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filters_dict: Optional[Dict[str, Any]] = None,
             filters_columns: Optional[List[ColumnElement]] = None,
             joins: Optional[List[Any]] = None,
+            approximate: bool = False,
     ) -> int:
         """
         Подсчитывает количество записей, соответствующих фильтрам.
@@ -532,6 +886,10 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filters_dict (Optional[Dict[str, Any]]): Простые фильтры.
             filters_columns (Optional[List[ColumnElement]]): Сложные фильтры.
             joins (Optional[List[Any]]): Джойны для подсчета.
+            approximate (bool, optional): Вернуть приблизительное количество
+                из статистики PostgreSQL (pg_class.reltuples) вместо полного
+                COUNT(*). Работает только без фильтров и джойнов; точность
+                зависит от свежести ANALYZE. Defaults to False.
 
         Returns:
             int: Количество записей.
@@ -539,10 +897,26 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Raises:
             SQLAlchemyError: При ошибке подсчета.
         """
-        logger.debug(f"Подсчет количества записей {self.model.__name__}")
+        logger.debug("Подсчет количества записей {}", self.model.__name__)
 
         try:
-            query = select(func.count(self.model.id))
+            if approximate and not (filters_dict or filters_columns or joins):
+                # CAST вместо ::, иначе парсер bind-параметров съедает
+                # последний символ имени (:table::regclass -> 'tabl')
+                result = await session.execute(
+                    text("SELECT CAST(reltuples AS bigint) FROM pg_class "
+                         "WHERE oid = CAST(:table AS regclass)"),
+                    {"table": self.model.__tablename__},
+                )
+                estimate = result.scalar()
+                # До первого ANALYZE статистики нет (-1/0) — считаем точно
+                if estimate is not None and estimate >= 0:
+                    logger.debug(
+                        "Приблизительно {} записей {}", estimate, self.model.__name__
+                    )
+                    return estimate
+
+            query = self._base_count
 
             query = self._add_filters_dict(query, filters_dict)
             query = self._add_joins(query, joins)
@@ -551,12 +925,12 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             result = await session.execute(query)
             count = result.scalar() or 0
 
-            logger.debug(f"Найдено {count} записей {self.model.__name__}")
+            logger.debug("Найдено {} записей {}", count, self.model.__name__)
             return count
 
-        except SQLAlchemyError as e:
-            logger.error(f"Ошибка при подсчете записей {self.model.__name__}: {e}")
-            raise e
+        except SQLAlchemyError:
+            logger.exception("Ошибка при подсчете записей {}", self.model.__name__)
+            raise
 
     @staticmethod
     async def add_relation(
@@ -568,7 +942,9 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Добавляет связь между объектами.
 
-        Поддерживает как связи один-ко-многим (списки), так и один-к-одному.
+        Поддерживает связи один-ко-многим (списки, множества, write-only
+        коллекции) и один-к-одному. Для set- и write-only коллекций проверка
+        членства не требует загрузки всей коллекции.
 
         Args:
             session (AsyncSession): Асинхронная сессия.
@@ -592,13 +968,20 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         relation = getattr(instance, relation_name)
 
-        if isinstance(relation, list):
+        if isinstance(relation, WriteOnlyCollection):
+            # Коллекция не материализуется: добавление — отложенный INSERT
+            relation.add(related_instance)
+        elif isinstance(relation, set):
+            # relationship(collection_class=set): идемпотентное O(1) добавление
+            relation.add(related_instance)
+        elif isinstance(relation, list):
             if related_instance not in relation:
                 relation.append(related_instance)
         else:
             setattr(instance, relation_name, related_instance)
 
         await session.flush()
+        _invalidate_query_cache(session)
 
     @staticmethod
     async def remove_relation(
@@ -621,6 +1004,8 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             SQLAlchemyError: При ошибке сохранения.
 
         Особенности:
+            - Для write-only коллекций формирует отложенный DELETE без загрузки
+            - Для set-связей удаляет элемент за O(1) через discard
             - Для списковых связей удаляет элемент из списка
             - Для скалярных связей устанавливает значение в None
         """
@@ -629,7 +1014,13 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         relation = getattr(instance, relation_name)
 
-        if isinstance(relation, list):
+        if isinstance(relation, WriteOnlyCollection):
+            # Коллекция не материализуется: удаление — отложенный DELETE
+            relation.remove(related_instance)
+        elif isinstance(relation, set):
+            # relationship(collection_class=set): O(1) удаление без проверки in
+            relation.discard(related_instance)
+        elif isinstance(relation, list):
             if related_instance in relation:
                 relation.remove(related_instance)
         else:
@@ -637,3 +1028,4 @@ class DBManager(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(instance, relation_name, None)
 
         await session.flush()
+        _invalidate_query_cache(session)
@@ -1,15 +1,28 @@
 import asyncio
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession, AsyncEngine
 from functools import wraps
 from typing import AsyncIterator
 from loguru import logger
 from datetime import datetime
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
-from app.config import settings
+from app.config import get_settings
 
-SQL_DATABASE_URL = settings.database_url_posgresql
+# Текущая сессия запроса: вложенные вызовы методов под @connection
+# переиспользуют одну сессию/транзакцию вместо открытия новой
+_current_session: ContextVar[AsyncSession | None] = ContextVar("_current_session", default=None)
+
+
+def __getattr__(name: str):
+    """Ленивое разрешение модульных атрибутов (PEP 562).
+
+    SQL_DATABASE_URL вычисляется только при первом обращении к нему,
+    чтобы импорт модуля не требовал чтения конфигурации.
+    """
+    if name == "SQL_DATABASE_URL":
+        return get_settings().database_url_posgresql
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DatabaseSessionManager:
@@ -29,21 +42,29 @@ class DatabaseSessionManager:
     """
     def __init__(
             self,
-            database_url: str,
+            database_url: str | None = None,
             session_factory: async_sessionmaker[AsyncSession] | None = None,
             engine: AsyncEngine | None = None
     ) -> None:
         """Инициализация менеджера сессий.
 
         Args:
-            database_url: URL для подключения к БД
+            database_url: URL для подключения к БД.
+                Если не указан, берется из настроек при первом обращении.
             session_factory: Опциональная фабрика сессий
             engine: Опциональный существующий движок
         """
-        self.database_url = database_url
+        self._database_url = database_url
         self.engine = engine
         self.session_factory = session_factory
 
+    @property
+    def database_url(self) -> str:
+        """URL подключения к БД, разрешаемый лениво из настроек."""
+        if self._database_url is None:
+            self._database_url = get_settings().database_url_posgresql
+        return self._database_url
+
     async def init(self):
         """
         Инициализирует движок базы данных и фабрику сессий.
@@ -51,9 +72,21 @@ class DatabaseSessionManager:
         Создает асинхронный движок с переданным URL и настраивает фабрику сессий
         с отключенным autoflush и expire_on_commit для лучшего контроля над сессиями.
         Должен вызываться при начале работы приложения.
+
+        Пул соединений конфигурируется явно: фиксированный размер с запасом
+        overflow и периодическим пересозданием соединений вместо ленивых
+        дефолтов, чтобы поведение под нагрузкой было предсказуемым.
         """
         self.engine = create_async_engine(
             url=self.database_url,
+            pool_size=20,
+            max_overflow=10,
+            pool_recycle=1800,
+            pool_pre_ping=False,
+            # Крупные executemany-вставки (add_all) идут страницами по 1000
+            # строк: меньше round-trip'ов ценой большего объема одного
+            # стейтмента в памяти
+            insertmanyvalues_page_size=1000,
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
@@ -61,6 +94,26 @@ class DatabaseSessionManager:
             autoflush=False
         )
 
+    async def warmup(self, pool_size: int = 20):
+        """
+        Прогревает пул соединений при старте приложения.
+
+        Параллельно открывает и возвращает в пул pool_size соединений, чтобы
+        стоимость TCP/TLS-рукопожатий была оплачена на старте, а не первыми
+        запросами.
+
+        Args:
+            pool_size (int, optional): Количество прогреваемых соединений.
+                По умолчанию совпадает с размером пула движка. Defaults to 20.
+        """
+        logger.info(f"Прогрев пула соединений: {pool_size} соединений")
+        connections = await asyncio.gather(
+            *[self.engine.connect() for _ in range(pool_size)]
+        )
+        for connection in connections:
+            await connection.close()
+        logger.info("Пул соединений прогрет")
+
     async def close(self):
         """
         Закрывает соединения с базой данных.
@@ -101,11 +154,15 @@ class DatabaseSessionManager:
         start_time = datetime.now()
         logger.info(f"Создание новой сессии. Изоляция: {isolation_level}, Автокоммит: {commit}")
         async with self.session_factory() as session:
+            # Кэш результатов SELECT на время жизни сессии (см. QueryWrapper)
+            session.info["query_cache"] = {}
             try:
                 if isolation_level:
                     logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                    await session.execute(
-                        text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}")
+                    # Уровень изоляции задается на DBAPI-соединении,
+                    # без отдельного SET TRANSACTION round-trip'а
+                    await session.connection(
+                        execution_options={"isolation_level": isolation_level}
                     )
                 yield session
                 if commit:
@@ -117,10 +174,40 @@ class DatabaseSessionManager:
                 logger.info("Выполнен откат транзакции")
                 raise
             finally:
-                await session.close()
+                # Закрытие сессии выполняет сам async with
                 exec_time = (datetime.now() - start_time).total_seconds()
                 logger.info(f"Сессия закрыта. Время выполнения: {exec_time:.2f} сек")
 
+    async def gather_reads(self, *wrappers) -> list:
+        """
+        Параллельно выполняет независимые запросы на чтение.
+
+        Каждый запрос получает собственную сессию из фабрики, поэтому чтения
+        перекрываются по I/O: общее время равно максимальной из задержек,
+        а не их сумме. Параллелизм ограничен свободными соединениями пула.
+
+        Warning:
+            Запросы идут в разных сессиях и транзакциях, поэтому семантика
+            read-your-writes теряется: незакоммиченные изменения текущей
+            сессии не видны. Для чтений, зависящих от своих же записей,
+            используйте общую сессию последовательно.
+
+        Args:
+            *wrappers (QueryWrapper): Обертки запросов для выполнения.
+
+        Returns:
+            list: Результаты scalars_all каждого запроса в порядке передачи.
+        """
+        logger.debug(f"Параллельное выполнение {len(wrappers)} запросов на чтение")
+
+        async def _one(wrapper):
+            async with self.session_factory() as session:  # type: ignore
+                return await wrapper.scalars_all(session)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_one(wrapper)) for wrapper in wrappers]
+        return [task.result() for task in tasks]
+
     def connection(self, isolation_level: str | None = None, commit: bool = False):
         """
         Декоратор для оборачивания методов в транзакцию БД.
@@ -139,18 +226,34 @@ class DatabaseSessionManager:
 
         Warning:
             Декорируемый метод должен принимать параметр 'session' в своей сигнатуре.
+
+        Вложенные вызовы декорированных методов в рамках одного запроса
+        переиспользуют уже открытую сессию (ее жизненным циклом управляет
+        внешний вызов), поэтому несколько декорированных методов не плодят
+        по соединению и транзакции на каждый вызов.
         """
         def decorator(method):
             @wraps(method)
             async def wrapper(*args, **kwargs):
+                existing_session = _current_session.get()
+                if existing_session is not None:
+                    # Вложенный вызов: коммит/закрытие делает внешний вызов
+                    return await method(*args, session=existing_session, **kwargs)
                 start_time = datetime.now()
                 logger.info(
                     f"Начало транзакции для {method.__name__}. Изоляция: {isolation_level}, Автокоммит: {commit}")
                 async with self.session_factory() as session:  # type: ignore
+                    # Кэш результатов SELECT на время жизни сессии (см. QueryWrapper)
+                    session.info["query_cache"] = {}
+                    token = _current_session.set(session)
                     try:
                         if isolation_level:
                             logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                            await session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}"))
+                            # Уровень изоляции задается на DBAPI-соединении,
+                            # без отдельного SET TRANSACTION round-trip'а
+                            await session.connection(
+                                execution_options={"isolation_level": isolation_level}
+                            )
                         result = await method(*args, session=session, **kwargs)
                         if commit:
                             await session.commit()
@@ -162,7 +265,8 @@ class DatabaseSessionManager:
                         logger.info("Выполнен откат транзакции")
                         raise
                     finally:
-                        await session.close()
+                        # Закрытие сессии выполняет сам async with
+                        _current_session.reset(token)
                         exec_time = (datetime.now() - start_time).total_seconds()
                         logger.info(f"Транзакция завершена. Время выполнения: {exec_time:.2f} сек")
 
@@ -172,5 +276,5 @@ class DatabaseSessionManager:
 
 
 # Глобальный экземпляр менеджера сессий
-session_manager = DatabaseSessionManager(SQL_DATABASE_URL)
+session_manager = DatabaseSessionManager()
 asyncio.run(session_manager.init())